@@ -1,11 +1,46 @@
 import time
+import json
+import random
+import threading
+import concurrent.futures
+from collections import OrderedDict
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from .utils import BaseRequest
 import PIL.Image
 import io
+import os
 import base64
+import mimetypes
+import mmap
+
+try:
+    # orjson parses straight from bytes and is several times faster than
+    # the stdlib on the large completed-task result bodies
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Seeds are normalized into the API's accepted range; -1 means "random"
+_SEED_MOD = 9_999_999_999
+
+# Task states that will never change again; only _SUCCESS_STATES carry outputs
+_TERMINAL_STATES = frozenset({"completed", "failed", "canceled"})
+_SUCCESS_STATES = frozenset({"completed"})
+
+# Advertise Brotli only when a decoder is importable; completed-task
+# bodies (long URLs, repeated metadata) compress several-fold under br
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
 
 
 class WaveSpeedClient:
@@ -26,13 +61,39 @@ class WaveSpeedClient:
         """
         self.api_key = api_key
         self.once_timeout = 1800  # Default timeout is 1800 seconds (30 minutes)
+        # Whether the API honors the long-poll `wait` query parameter.
+        # None = unknown (try it), True = confirmed, False = rejected.
+        self._supports_long_poll = None
+
+        # Whether the API exposes the multi-request batch endpoint.
+        # None = unknown (probe on first use), True/False once probed.
+        self._supports_batch = None
+
+        # In-flight request deduplication: concurrent callers issuing the
+        # same status check or submission share one HTTP request.
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+        # Terminal task results are immutable, so cache them and skip the
+        # network entirely on repeat status checks. Bounded LRU.
+        self._result_cache = OrderedDict()
+        self._result_cache_maxsize = 512
 
         self.headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
         # Create session with connection pooling and retry strategy
         self.session = requests.Session()
-
-        # Configure retry strategy
+        # Authorization lives on the session so no per-call header dict is
+        # needed; Content-Type is set by requests itself (json= for JSON
+        # bodies, the multipart boundary for uploads)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+        })
+
+        # Configure retry strategy. The default method allowlist excludes
+        # POST on purpose: auto-retrying a submission whose response was lost
+        # could enqueue (and bill) the same generation task twice.
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
@@ -40,16 +101,28 @@ class WaveSpeedClient:
             connect=3,  # Retry connection failures
         )
 
-        # Configure adapter with timeouts
+        # Configure adapter with timeouts. The pool is sized so concurrent
+        # batch workers (send_requests) each get their own keep-alive
+        # connection instead of serializing on a shared socket.
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
             pool_connections=10,
-            pool_maxsize=20
+            pool_maxsize=32
         )
 
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
+    def close(self):
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def post(self, endpoint, payload, timeout=60):
         """
         Send POST request to WaveSpeed AI API
@@ -68,29 +141,66 @@ class WaveSpeedClient:
         read_timeout = timeout
         timeout_tuple = (connect_timeout, read_timeout)
 
-        response = self.session.post(url, headers=self.headers, json=payload, timeout=timeout_tuple)
+        response = self.session.post(url, json=payload, timeout=timeout_tuple)
+
+        # Success fast path: parse the body once and unwrap
+        if response.status_code == 200:
+            return self._handle_response(_loads(response.content))
 
         if response.status_code == 401:
             raise Exception("Unauthorized: Invalid API key")
 
-        if response.status_code != 200:
-            error_message = f"Error: {response.status_code}"
-            try:
-                error_data = response.json()
-                if "message" in error_data:
-                    error_message = f"Error: {error_data['message']}"
-            except:
-                pass
-            raise Exception(error_message)
-
-        response_data = response.json()
-        if isinstance(response_data, dict) and 'code' in response_data:
-            if response_data['code'] == 401:
-                raise Exception("Unauthorized: Invalid API key")
-            if response_data['code'] != 200:
-                raise Exception(f"API Error: {response_data.get('message', 'Unknown error')}")
-            return response_data.get('data', {})
-        return response_data
+        raise Exception(self._error_message(response, "message"))
+
+    @staticmethod
+    def _error_message(response, key):
+        """
+        Build an error message from a non-200 response
+
+        Reads the raw body once and only attempts a JSON parse on it; error
+        pages that are not JSON fall back to a short decoded snippet instead
+        of going through charset detection.
+
+        Args:
+            response: The failed requests response
+            key (str): JSON field holding the server's error description
+
+        Returns:
+            str: Human-readable error message
+        """
+        body = response.content
+        try:
+            error_data = _loads(body)
+            if key in error_data:
+                return f"Error: {error_data[key]}"
+        except Exception:
+            pass
+        if body:
+            return f"Error: {response.status_code}: {body[:200].decode(errors='replace')}"
+        return f"Error: {response.status_code}"
+
+    def _handle_response(self, response_data):
+        """
+        Unwrap the standard {code, message, data} response envelope
+
+        Args:
+            response_data: Parsed JSON response body
+
+        Returns:
+            dict: The data payload, or the body unchanged if it is not enveloped
+        """
+        try:
+            code = response_data.get('code')
+        except AttributeError:
+            # Non-dict bodies pass through untouched
+            return response_data
+        if code is None:
+            return response_data
+        if code == 401:
+            raise Exception("Unauthorized: Invalid API key")
+        if code != 200:
+            raise Exception(f"API Error: {response_data.get('message', 'Unknown error')}")
+        return response_data.get('data', {})
 
     def get(self, endpoint, params=None, timeout=30):
         """
@@ -104,54 +214,164 @@ class WaveSpeedClient:
         Returns:
             dict: API response
         """
-        url = f"{self.BASE_URL}{endpoint}"
+        return self._get_url(f"{self.BASE_URL}{endpoint}", params=params, timeout=timeout)
+
+    def _get_url(self, url, params=None, timeout=30):
+        """
+        Send GET request to a prebuilt URL
+
+        Hot loops (polling) build the URL once and call this directly,
+        skipping the BASE_URL concatenation on every iteration.
+
+        Args:
+            url (str): Full request URL
+            params (dict, optional): Query parameters
+            timeout (float, optional): Request timeout in seconds
+
+        Returns:
+            dict: API response
+        """
         # Use tuple for timeout: (connect_timeout, read_timeout)
         connect_timeout = min(10, timeout / 3)  # Up to 10s for connection, or 1/3 of total timeout
         read_timeout = timeout
         timeout_tuple = (connect_timeout, read_timeout)
 
-        response = self.session.get(url, headers=self.headers, params=params, timeout=timeout_tuple)
+        response = self.session.get(url, params=params, timeout=timeout_tuple)
 
-        if response.status_code != 200:
-            error_message = f"Error: {response.status_code}"
-            try:
-                error_data = response.json()
-                if "error" in error_data:
-                    error_message = f"Error: {error_data['error']}"
-            except:
-                pass
-            raise Exception(error_message)
-
-        response_data = response.json()
-        if isinstance(response_data, dict) and 'code' in response_data:
-            if response_data['code'] != 200:
-                raise Exception(f"API Error: {response_data.get('message', 'Unknown error')}")
-            return response_data.get('data', {})
-        return response_data
+        # Success fast path: parse the body once and unwrap
+        if response.status_code == 200:
+            return self._handle_response(_loads(response.content))
+
+        raise Exception(self._error_message(response, "error"))
 
-    def check_task_status(self, request_id):
+    def _deduplicated(self, key, request_func):
+        """
+        Run request_func at most once per key across concurrent callers.
+
+        The first caller for a key performs the HTTP request; any caller
+        arriving while it is still in flight waits on the same Future and
+        shares its result (or exception) instead of issuing a duplicate call.
+
+        Args:
+            key: Hashable identity of the request.
+            request_func (callable): Zero-argument function performing the request.
+
+        Returns:
+            The result of request_func.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                owner = False
+            else:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = request_func()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def check_task_status(self, request_id, wait=None, url=None):
         """
         Check the status of a task
 
         Args:
             request_id (str): Task ID
+            wait (int, optional): Ask the server to hold the request open for
+                up to this many seconds until the task changes state
+                (long-poll). Falls back to an immediate check if the server
+                rejects the parameter.
+            url (str, optional): Prebuilt result URL; polling loops pass this
+                to avoid rebuilding the same string every iteration.
 
         Returns:
             dict: Task status information, including status, progress, output, etc.
         """
         if not request_id:
             raise Exception("No valid task ID provided")
+
+        cached = self._result_cache.get(request_id)
+        if cached is not None:
+            return cached
+
+        result = self._deduplicated(("status", request_id, wait),
+                                    lambda: self._fetch_task_status(request_id, wait, url))
+
+        if result and result.get("status") in _TERMINAL_STATES:
+            self._result_cache[request_id] = result
+            self._result_cache.move_to_end(request_id)
+            if len(self._result_cache) > self._result_cache_maxsize:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def clear_cache(self):
+        """Clear cached terminal task results."""
+        self._result_cache.clear()
+
+    def _fetch_task_status(self, request_id, wait=None, url=None):
+        """Perform the actual status GET for check_task_status."""
+        if url is None:
+            url = f"{self.BASE_URL}/api/v2/predictions/{request_id}/result"
+        if wait and self._supports_long_poll is not False:
+            started = time.monotonic()
+            try:
+                # Give the read timeout headroom over the server-side hold
+                result = self._get_url(url, params={"wait": wait}, timeout=wait + 10)
+            except requests.RequestException:
+                # Transport failures (timeouts, resets) say nothing about
+                # long-poll support; surface them instead of disabling it
+                raise
+            except Exception:
+                if self._supports_long_poll:
+                    raise
+                # HTTP rejection of the wait parameter; remember and short-poll
+                self._supports_long_poll = False
+            else:
+                if self._supports_long_poll is None:
+                    # A 200 alone proves nothing — a server that ignores the
+                    # unknown wait parameter also returns 200, instantly.
+                    # Only latch support once the server demonstrably held
+                    # the request open: the threshold scales with the
+                    # requested hold so a slow round trip alone cannot pass
+                    # for one.
+                    status = result.get("status") if result else None
+                    if time.monotonic() - started >= min(wait, 5):
+                        self._supports_long_poll = True
+                    elif status not in _TERMINAL_STATES:
+                        self._supports_long_poll = False
+                    # A quick terminal result is inconclusive; keep probing
+                return result
         # Use 30s timeout for status checks - these should be quick
-        return self.get(f"/api/v2/predictions/{request_id}/result", timeout=30)
+        return self._get_url(url, timeout=30)
 
-    def wait_for_task(self, request_id, polling_interval=5, timeout=None):
+    def wait_for_task(self, request_id, polling_interval=5, timeout=None,
+                      initial_interval=None, max_interval=15.0, backoff_factor=1.5):
         """
         Wait for task completion and return the result
 
+        Polls with exponential backoff and a small jitter: the first checks
+        happen quickly to catch fast tasks, then the interval grows up to
+        max_interval so long tasks do not hammer the API.
+
         Args:
             request_id (str, optional): Task ID.
-            polling_interval (int): Polling interval in seconds.
+            polling_interval (int): Base polling interval in seconds.
             timeout (int): Maximum time to wait for task completion in seconds.
+            initial_interval (float, optional): Delay before the second poll.
+                Defaults to a quarter of polling_interval (at least 0.5s).
+            max_interval (float): Upper bound for the backoff delay in seconds.
+            backoff_factor (float): Multiplier applied to the delay after each poll.
 
         Returns:
             dict: Task result.
@@ -165,21 +385,63 @@ class WaveSpeedClient:
         if not request_id:
             raise Exception("No valid task ID provided")
 
+        if initial_interval is None:
+            initial_interval = max(0.5, polling_interval * 0.25)
+        delay = initial_interval
+
+        # Build the result URL once for the whole polling loop
+        status_url = f"{self.BASE_URL}/api/v2/predictions/{request_id}/result"
+
         start_time = time.time()
         while time.time() - start_time < timeout:
-            task_status = self.check_task_status(request_id)
-            status = task_status.get("status")
-
-            if status == "completed":
-                return task_status
-            elif status == "failed":
+            remaining = timeout - (time.time() - start_time)
+            # Prefer a long-poll: the server holds the request open until the
+            # task changes state, capped safely under proxy idle timeouts.
+            wait = min(25, max(1, int(remaining))) if self._supports_long_poll is not False else None
+            poll_started = time.monotonic()
+            task_status = self.check_task_status(request_id, wait=wait, url=status_url)
+            status = task_status.get("status") if task_status else None
+
+            if status in _TERMINAL_STATES:
+                if status in _SUCCESS_STATES:
+                    return task_status
                 error_message = task_status.get("error", "Task failed")
                 raise Exception(f"Task failed: {error_message}")
 
-            time.sleep(polling_interval)
+            if self._supports_long_poll and wait \
+                    and time.monotonic() - poll_started >= min(wait, 5):
+                # The server actually held the request open; poll again
+                # immediately. Returns faster than the requested hold fall
+                # through to the sleep below, so neither an ignored wait hint
+                # nor plain network latency can turn into a hot loop.
+                continue
+
+            # Sleep with jitter, then grow the delay for the next round
+            time.sleep(min(max_interval, delay) + random.uniform(0, delay * 0.1))
+            delay = min(max_interval, delay * backoff_factor)
 
         raise Exception("Task timed out")
 
+    @staticmethod
+    def _normalize_payload(payload):
+        """
+        Apply the standard submission fixups to a built payload
+
+        Outputs must come back as URLs (base64 bodies cannot be classified
+        downstream) and seeds are clamped into the API's accepted range.
+
+        Args:
+            payload (dict): Payload from build_payload; modified in place.
+
+        Returns:
+            dict: The same payload, normalized.
+        """
+        payload["enable_base64_output"] = False
+        seed = payload.get("seed")
+        if seed is not None:
+            payload["seed"] = -1 if seed == -1 else seed % _SEED_MOD
+        return payload
+
     def send_request(self, request: BaseRequest, wait_for_completion=True, polling_interval=5, timeout=None):
         """
         Sends an API request using a request object.
@@ -193,14 +455,17 @@ class WaveSpeedClient:
         Returns:
             dict: API response or task result.
         """
-        payload = request.build_payload()
-        payload["enable_base64_output"] = False
-        if "seed" in payload:
-            payload["seed"] = payload["seed"] % 9999999999 if payload["seed"] != -1 else -1
+        payload = self._normalize_payload(request.build_payload())
 
         # Use appropriate timeout for initial request submission
         initial_timeout = 60  # 60s for initial request submission
-        response = self.post(request.get_api_path(), payload, timeout=initial_timeout)
+        # Prefer the class-level constant when the request defines one,
+        # skipping the method indirection
+        api_path = getattr(request, "API_PATH", None) or request.get_api_path()
+        # Submissions are never deduplicated: identical payloads are still
+        # distinct jobs (seed=-1 means server-side random), so each call must
+        # issue its own POST. Only status checks share in-flight requests.
+        response = self.post(api_path, payload, timeout=initial_timeout)
 
         request_id = response.get("id")
         if not request_id:
@@ -209,37 +474,189 @@ class WaveSpeedClient:
         if not wait_for_completion:
             return {"request_id": request_id, "status": "processing"}
 
+        # Brief pause before the first poll: the server needs a moment to
+        # enqueue the task, and fast jobs then complete on the very first
+        # status check instead of after a full polling interval
+        time.sleep(0.25)
         task_result = self.wait_for_task(request_id, polling_interval=polling_interval, timeout=timeout)
         return task_result
 
-    def upload_file(self, image: PIL.Image.Image):
+    def send_requests(self, requests_list, max_workers=10, wait_for_completion=True, polling_interval=5, timeout=None):
+        """
+        Sends multiple API requests concurrently and collects the results.
+
+        Each request is submitted and polled on its own worker thread, so the
+        network waits of N jobs overlap instead of running back to back. The
+        shared session's connection pool is reused across workers.
+
+        Args:
+            requests_list (list[BaseRequest]): Request objects to send.
+            max_workers (int): Maximum number of concurrent submissions.
+            wait_for_completion (bool, optional): Whether to wait for task completion.
+            polling_interval (int): Polling interval in seconds.
+            timeout (int): Maximum time to wait for each task in seconds.
+
+        Returns:
+            list[dict]: Results in the same order as requests_list.
+        """
+        if not requests_list:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.send_request,
+                    request,
+                    wait_for_completion=wait_for_completion,
+                    polling_interval=polling_interval,
+                    timeout=timeout,
+                )
+                for request in requests_list
+            ]
+            return [future.result() for future in futures]
+
+    def _check_batch_support(self):
+        """Probe once whether the API exposes the batch submission endpoint."""
+        if self._supports_batch is None:
+            try:
+                capabilities = self.get("/api/v2/capabilities", timeout=10)
+                self._supports_batch = bool(capabilities.get("supports_batch"))
+            except Exception:
+                self._supports_batch = False
+        return self._supports_batch
+
+    def send_batch(self, requests_list, wait_for_completion=True, polling_interval=5, timeout=None):
+        """
+        Submit multiple requests in a single POST when the API supports it.
+
+        Coalesces N submissions into one round trip against /api/v2/batch.
+        Capability is probed once and cached; if the endpoint is unavailable
+        the batch degrades to concurrent individual submissions via
+        send_requests.
+
+        Args:
+            requests_list (list[BaseRequest]): Request objects to submit.
+            wait_for_completion (bool, optional): Whether to wait for the tasks to finish.
+            polling_interval (int): Polling interval in seconds.
+            timeout (int): Maximum time to wait for each task in seconds.
+
+        Returns:
+            list[dict]: Per-request results (or id/status pairs when not waiting),
+                in the same order as requests_list.
+        """
+        if not requests_list:
+            return []
+
+        if not self._check_batch_support():
+            return self.send_requests(requests_list,
+                                      wait_for_completion=wait_for_completion,
+                                      polling_interval=polling_interval,
+                                      timeout=timeout)
+
+        payload = [
+            {
+                "path": getattr(request, "API_PATH", None) or request.get_api_path(),
+                # Same per-request fixups as send_request
+                "body": self._normalize_payload(request.build_payload()),
+            }
+            for request in requests_list
+        ]
+        responses = self.post("/api/v2/batch", payload, timeout=60)
+
+        results = [{"request_id": item.get("id"), "status": item.get("status", "processing")}
+                   for item in responses]
+        if not wait_for_completion:
+            return results
+        return self.wait_for_batch([item["request_id"] for item in results],
+                                   polling_interval=polling_interval, timeout=timeout)
+
+    def wait_for_batch(self, request_ids, polling_interval=5, timeout=None, max_workers=10):
+        """
+        Wait for multiple tasks concurrently and return their results.
+
+        Args:
+            request_ids (list[str]): Task IDs to wait for.
+            polling_interval (int): Polling interval in seconds.
+            timeout (int): Maximum time to wait for each task in seconds.
+            max_workers (int): Maximum number of concurrently polled tasks.
+
+        Returns:
+            list[dict]: Task results in the same order as request_ids.
+        """
+        if not request_ids:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.wait_for_task, request_id,
+                                polling_interval=polling_interval, timeout=timeout)
+                for request_id in request_ids
+            ]
+            return [future.result() for future in futures]
+
+    def upload_file(self, image: PIL.Image.Image, format=None, quality=90):
         """
         Upload a file to WaveSpeed AI API
 
+        If the image was loaded from a supported file on disk, its already
+        compressed bytes are streamed as-is, skipping the re-encode entirely.
+        Otherwise the image is encoded once: alpha-bearing and palette
+        images as fast PNG, plain RGB/L images as JPEG (or the requested
+        format).
+
         Args:
-            image (PIL.Image.Image): Image to be uploaded
+            image (PIL.Image.Image | str | os.PathLike): Image (or path to an
+                image file) to be uploaded
+            format (str, optional): Force an encoding format (e.g. "PNG", "JPEG", "WEBP")
+            quality (int, optional): Quality for lossy formats
 
         Returns:
             dict: API response containing the uploaded file information
         """
-        url = f"{self.BASE_URL}/api/v2/media/upload/binary"
+        path = None
+        if isinstance(image, (str, os.PathLike)):
+            path = os.fspath(image)
+        elif format is None:
+            # Fast path: the source file already holds compressed bytes
+            filename = getattr(image, "filename", None)
+            if filename and os.path.isfile(filename) \
+                    and os.path.splitext(filename)[1].lower() in (".png", ".jpg", ".jpeg", ".webp"):
+                path = filename
+
+        if path is not None:
+            # Zero-copy: map the on-disk bytes and stream them directly,
+            # no re-encode and no duplicate in-memory buffer
+            content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._upload({'file': (os.path.basename(path), mm, content_type)})
+
+        if format:
+            fmt = format.upper()
+        elif image.mode in ("RGB", "L"):
+            fmt = "JPEG"
+        else:
+            # Anything carrying alpha (RGBA/LA/PA/RGBa) or a palette must
+            # stay lossless PNG; pushing it through JPEG would silently
+            # drop transparency
+            fmt = "PNG"
         buffered = io.BytesIO()
-        image.save(buffered, format="PNG")
-        buffered.seek(0)
-        files = {'file': ('image.png', buffered, 'image/png')}
-        # Set timeout for file uploads: (connect_timeout, read_timeout)
-        timeout_tuple = (15, 180)  # 15s connect, 180s read for uploads
-        response = self.session.post(url, headers={'Authorization': f'Bearer {self.api_key}'}, files=files, timeout=timeout_tuple)
-
-        if response.status_code != 200:
-            raise Exception(f"Upload failed: {response.status_code}")
-
-        response_data = response.json()
-        if isinstance(response_data, dict) and 'code' in response_data:
-            if response_data['code'] != 200:
-                raise Exception(f"API Error: {response_data.get('message', 'Unknown error')}")
-            return response_data.get('data', {})["download_url"]
-        raise Exception("No download URL in response")
+        if fmt == "PNG":
+            if image.mode in ("RGBa", "La", "PA"):
+                # Premultiplied/paired-alpha modes have no direct PNG
+                # encoding; unify on RGBA
+                image = image.convert("RGBA")
+            # Low compression level: much faster than the default, the
+            # upload is transient so size matters less than CPU time
+            image.save(buffered, format="PNG", optimize=False, compress_level=1)
+        else:
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            save_kwargs = {"quality": quality}
+            if fmt == "JPEG":
+                save_kwargs["subsampling"] = 2
+            image.save(buffered, format=fmt, **save_kwargs)
+        ext = "jpg" if fmt == "JPEG" else fmt.lower()
+        content_type = "image/jpeg" if fmt == "JPEG" else f"image/{fmt.lower()}"
+        # getbuffer() hands the encoder a memoryview without copying
+        return self._upload({'file': (f"image.{ext}", buffered.getbuffer(), content_type)})
 
 
     def upload_file_with_type(self, file_path: str, file_type: str):
@@ -249,26 +666,37 @@ class WaveSpeedClient:
         Args:
             video_path (str): Path to the video to be uploaded
         """
+        file_name = ""
+        if "video" in file_type:
+            file_name = "video.mp4"
+        elif "image" in file_type:
+            file_name = "image.png"
+        elif "audio" in file_type:
+            file_name = "audio.mp3"
+        else:
+            raise Exception("Invalid file type")
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return self._upload({'file': (file_name, mm, file_type)})
+
+    def _upload(self, files):
+        """
+        POST a prepared multipart body to the binary upload endpoint
+
+        Args:
+            files (dict): Multipart file mapping for requests
+
+        Returns:
+            str: Download URL of the uploaded file
+        """
         url = f"{self.BASE_URL}/api/v2/media/upload/binary"
-        with open(file_path, "rb") as file:
-            file_name = ""
-            if "video" in file_type:
-               file_name = "video.mp4"
-            elif "image" in file_type:
-                file_name = "image.png"
-            elif "audio" in file_type:
-                file_name = "audio.mp3"
-            else:
-                raise Exception("Invalid file type")
-            files = {'file': (file_name, file, file_type)}
-            # Set timeout for file uploads: (connect_timeout, read_timeout)
-            timeout_tuple = (15, 180)  # 15s connect, 180s read for uploads
-            response = self.session.post(url, headers={'Authorization': f'Bearer {self.api_key}'}, files=files, timeout=timeout_tuple)
+        # Set timeout for file uploads: (connect_timeout, read_timeout)
+        timeout_tuple = (15, 180)  # 15s connect, 180s read for uploads
+        response = self.session.post(url, files=files, timeout=timeout_tuple)
 
         if response.status_code != 200:
             raise Exception(f"Upload failed: {response.status_code}")
 
-        response_data = response.json()
+        response_data = _loads(response.content)
         if isinstance(response_data, dict) and 'code' in response_data:
             if response_data['code'] != 200:
                 raise Exception(f"API Error: {response_data.get('message', 'Unknown error')}")
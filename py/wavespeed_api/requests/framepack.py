@@ -22,21 +22,9 @@ class Framepack(BaseRequest):
     guidance_scale: Optional[float] = Field(10.0, description="Guidance scale for the generation.", ge=0.0, le=32.0)
     enable_safety_checker: Optional[bool] = Field(True, description="If set to true, the safety checker will be enabled.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "image": self.image,
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "aspect_ratio": self.aspect_ratio,
-            "resolution": self.resolution,
-            "seed": self.seed,
-            "num_inference_steps": self.num_inference_steps,
-            "num_frames": self.num_frames,
-            "guidance_scale": self.guidance_scale,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("image", "prompt", "negative_prompt", "aspect_ratio", "resolution",
+                       "seed", "num_inference_steps", "num_frames", "guidance_scale",
+                       "enable_safety_checker")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
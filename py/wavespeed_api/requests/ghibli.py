@@ -13,13 +13,7 @@ class Ghibli(BaseRequest):
     image: str = Field(..., description="The image to generate an image from.")
     enable_safety_checker: Optional[bool] = Field(True, description="If set to true, the safety checker will be enabled.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "image": self.image,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("image", "enable_safety_checker")
 
     def get_api_path(self) -> str:
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
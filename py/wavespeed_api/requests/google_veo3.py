@@ -11,14 +11,7 @@ class GoogleVeo3(BaseRequest):
     prompt: str = Field(..., description="Text prompt for generation")
     seed: Optional[int] = Field(default=-1, description=" The same seed and the same prompt given to the same version of the model will output the same image every time. ")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "seed": self.seed
-        }
-
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "seed")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -16,19 +16,8 @@ class GoogleVeo3Fast(BaseRequest):
     generate_audio: bool = Field(False, description="Whether to generate audio for the video.")
     seed: Optional[int] = Field(default=-1, description=" The same seed and the same prompt given to the same version of the model will output the same image every time. ")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "aspect_ratio": self.aspect_ratio,
-            "duration": self.duration,
-            "enable_prompt_expansion": self.enable_prompt_expansion,
-            "generate_audio": self.generate_audio,
-            "seed": self.seed
-        }
-
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "negative_prompt", "aspect_ratio", "duration",
+                       "enable_prompt_expansion", "generate_audio", "seed")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
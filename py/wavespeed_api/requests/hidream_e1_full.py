@@ -13,15 +13,7 @@ class HidreamE1Full(BaseRequest):
     seed: Optional[int] = Field(default=-1, description="\n            The same seed and the same prompt given to the same version of the model\n            will output the same image every time.\n        ")
     enable_safety_checker: Optional[bool] = Field(default=True, description="If set to true, the safety checker will be enabled.")  # In JSON, this field has "disabled": true
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "image": self.image,
-            "seed": self.seed,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "image", "seed", "enable_safety_checker")
 
     def get_api_path(self) -> str:
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -17,18 +17,8 @@ class Hunyuan3DV2MultiView(BaseRequest):
     octree_resolution: Optional[int] = Field(256, ge=64, le=512, description="Resolution of the octree.")
     textured_mesh: Optional[bool] = Field(False, description="Whether to generate a textured mesh.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "back_image_url": self.back_image_url,
-            "front_image_url": self.front_image_url,
-            "left_image_url": self.left_image_url,
-            "guidance_scale": self.guidance_scale,
-            "num_inference_steps": self.num_inference_steps,
-            "octree_resolution": self.octree_resolution,
-            "textured_mesh": self.textured_mesh,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("back_image_url", "front_image_url", "left_image_url", "guidance_scale",
+                       "num_inference_steps", "octree_resolution", "textured_mesh")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
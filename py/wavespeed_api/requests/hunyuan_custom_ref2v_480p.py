@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -22,27 +22,22 @@ class HunyuanCustomRef2V480p(BaseRequest):
     size: Optional[str] = Field("832*480", description="The size of the output.", enum=["832*480", "480*832"])
     enable_safety_checker: Optional[bool] = Field(True, description="If set to true, the safety checker will be enabled.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "image": self.image,
-            "negative_prompt": self.negative_prompt,
-            "guidance_scale": self.guidance_scale,
-            "flow_shift": self.flow_shift,
-            "seed": self.seed,
-            "size": self.size,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "image", "negative_prompt", "guidance_scale",
+                       "flow_shift", "seed", "size", "enable_safety_checker")
+
+    # Corresponds to api_path / required / x-order-properties in the interface configuration json
+    API_PATH: ClassVar[str] = "/api/v3/wavespeed-ai/hunyuan-custom-ref2v-480p"
+    FIELD_REQUIRED: ClassVar[tuple] = ("image",)
+    FIELD_ORDER: ClassVar[tuple] = ("prompt", "image", "negative_prompt", "guidance_scale",
+                                    "flow_shift", "seed", "size", "enable_safety_checker")
 
     def get_api_path(self):
-        """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
-        return "/api/v3/wavespeed-ai/hunyuan-custom-ref2v-480p"
+        """Gets the API path for the request."""
+        return self.API_PATH
 
     def field_required(self):
-        return ["image"]
+        return self.FIELD_REQUIRED
 
     def field_order(self):
-        """Corresponds to x-order-properties in the interface configuration json"""
-        return ["prompt", "image", "negative_prompt", "guidance_scale", "flow_shift", "seed", "size", "enable_safety_checker"]
+        """Get field order"""
+        return self.FIELD_ORDER
@@ -19,18 +19,8 @@ class HunyuanVideoI2V(BaseRequest):
     size: Optional[str] = Field("1280*720", description="The size of the output.", enum=["1280*720", "720*1280"])
     enable_safety_checker: Optional[bool] = Field(True, description="If set to true, the safety checker will be enabled.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "image": self.image,
-            "num_inference_steps": self.num_inference_steps,
-            "duration": self.duration,
-            "seed": self.seed,
-            "size": self.size,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "image", "num_inference_steps", "duration", "seed", "size",
+                       "enable_safety_checker")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
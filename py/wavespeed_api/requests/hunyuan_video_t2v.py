@@ -14,16 +14,7 @@ class HunyuanVideoT2V(BaseRequest):
     num_inference_steps: Optional[int] = Field(30, description="The number of inference steps to run. Lower gets faster results, higher gets better results.", ge=2, le=30)
     enable_safety_checker: Optional[bool] = Field(True, description="If set to true, the safety checker will be enabled.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "size": self.size,
-            "seed": self.seed,
-            "num_inference_steps": self.num_inference_steps,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "size", "seed", "num_inference_steps", "enable_safety_checker")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -26,17 +26,8 @@ class KwaivgiKlingV1x6I2VPro(BaseRequest):
     duration: Optional[int] = Field(default=5, description="Video Length, unit: s (seconds). ", ge=5, le=10)
 
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "image": self.image,
-            "end_image": self.end_image,
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "guidance_scale": self.guidance_scale,
-            "duration": self.duration,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("image", "end_image", "prompt", "negative_prompt", "guidance_scale",
+                       "duration")
 
     def get_api_path(self) -> str:
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -18,24 +18,20 @@ class KwaivgiKlingV16I2vStandard(BaseRequest):
         description="Text prompt for generation; Positive text prompt; Cannot exceed 2500 characters",
         max_length=2000)
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "duration": self.duration,
-            "guidance_scale": self.guidance_scale,
-            "image": self.image,
-            "negative_prompt": self.negative_prompt,
-            "prompt": self.prompt,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("duration", "guidance_scale", "image", "negative_prompt", "prompt")
+
+    # Corresponds to api_path / required / x-order-properties in the interface configuration json
+    API_PATH: ClassVar[str] = "/api/v3/kwaivgi/kling-v1.6-i2v-standard"
+    FIELD_REQUIRED: ClassVar[tuple] = ("image",)
+    FIELD_ORDER: ClassVar[tuple] = ("prompt", "negative_prompt", "image", "guidance_scale", "duration")
 
     def get_api_path(self):
-        """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
-        return "/api/v3/kwaivgi/kling-v1.6-i2v-standard"
+        """Gets the API path for the request."""
+        return self.API_PATH
 
     def field_required(self):
-        return ['image']
+        return self.FIELD_REQUIRED
 
     def field_order(self):
-        """Corresponds to x-order-properties in the interface configuration json"""
-        return ['prompt', 'negative_prompt', 'image', 'guidance_scale', 'duration']
+        """Get field order"""
+        return self.FIELD_ORDER
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -13,24 +13,20 @@ class KwaivgiKlingV1x6T2vStandard(BaseRequest):
     guidance_scale: Optional[float] = Field(0.5, description="Flexibility in video generation; The higher the value, the lower the model’s degree of flexibility, and the stronger the relevance to the user’s prompt.", ge=0, le=1)
     duration: Optional[int] = Field(default=5, description="Video Length, unit: s (seconds). ", ge=5, le=10)
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "guidance_scale": self.guidance_scale,
-            "duration": self.duration,
-        }
+    _PAYLOAD_FIELDS = ("prompt", "negative_prompt", "guidance_scale", "duration")
 
-        return self._remove_empty_fields(payload)
+    # Corresponds to api_path / required / x-order-properties in the interface configuration json
+    API_PATH: ClassVar[str] = "/api/v3/kwaivgi/kling-v1.6-t2v-standard"
+    FIELD_REQUIRED: ClassVar[tuple] = ("prompt",)
+    FIELD_ORDER: ClassVar[tuple] = ("prompt", "negative_prompt", "guidance_scale", "duration")
 
     def get_api_path(self):
-        """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
-        return "/api/v3/kwaivgi/kling-v1.6-t2v-standard"
+        """Gets the API path for the request."""
+        return self.API_PATH
 
     def field_required(self):
-        return ['prompt']
+        return self.FIELD_REQUIRED
 
     def field_order(self):
-        """Corresponds to x-order-properties in the interface configuration json"""
-        return ['prompt', 'negative_prompt', 'guidance_scale', 'duration']
+        """Get field order"""
+        return self.FIELD_ORDER
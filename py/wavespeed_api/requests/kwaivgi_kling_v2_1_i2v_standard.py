@@ -14,17 +14,7 @@ class KwaivgiKlingV2x1I2vStandard(BaseRequest):
     duration: Optional[int] = Field(default=5, description="Video duration in seconds", ge=5, le=10)
     guidance_scale: Optional[float] = Field(0.5, description="Flexibility in video generation; The higher the value, the lower the model's degree of flexibility", ge=0, le=1)
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "image": self.image,
-            "negative_prompt": self.negative_prompt,
-            "duration": self.duration,
-            "guidance_scale": self.guidance_scale
-        }
-
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "image", "negative_prompt", "duration", "guidance_scale")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
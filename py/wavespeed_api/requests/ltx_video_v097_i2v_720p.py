@@ -16,16 +16,7 @@ class LtxVideoV097I2V720p(BaseRequest):
     size: Optional[str] = Field("1280*720", description="The size of the output.", enum=["720*1280", "1280*720"])
     seed: Optional[int] = Field(-1, description="Random seed for generation")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "image": self.image,
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "size": self.size,
-            "seed": self.seed,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("image", "prompt", "negative_prompt", "size", "seed")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -20,19 +20,8 @@ class Magi124b(BaseRequest):
     enable_safety_checker: Optional[bool] = Field(True, description="If set to true, the safety checker will be enabled.")
     aspect_ratio: Optional[str] = Field("auto", description="Aspect ratio of the generated video. If 'auto', the aspect ratio will be determined automatically based on the input image.", enum=["auto", "16:9", "9:16", "1:1"])
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "image": self.image,
-            "num_frames": self.num_frames,
-            "frames_per_second": self.frames_per_second,
-            "seed": self.seed,
-            "resolution": self.resolution,
-            "enable_safety_checker": self.enable_safety_checker,
-            "aspect_ratio": self.aspect_ratio,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "image", "num_frames", "frames_per_second", "seed",
+                       "resolution", "enable_safety_checker", "aspect_ratio")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
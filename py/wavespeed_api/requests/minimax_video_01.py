@@ -24,14 +24,7 @@ class MinimaxVideo01(BaseRequest):
         description="The model automatically optimizes incoming prompts to improve build quality.",
         title="Use prompt optimizer")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "image": self.image,
-            "enable_prompt_expansion": self.enable_prompt_expansion,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "image", "enable_prompt_expansion")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -17,19 +17,8 @@ class MmaudioV2(BaseRequest):
     guidance_scale: Optional[float] = Field(4.5, description="The strength of Classifier Free Guidance.", ge=0, le=20)
     mask_away_clip: Optional[bool] = Field(False, description="Whether to mask away the clip.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "video": self.video,
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "seed": self.seed,
-            "num_inference_steps": self.num_inference_steps,
-            "duration": self.duration,
-            "guidance_scale": self.guidance_scale,
-            "mask_away_clip": self.mask_away_clip,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("video", "prompt", "negative_prompt", "seed", "num_inference_steps",
+                       "duration", "guidance_scale", "mask_away_clip")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import Field
 from ..utils import BaseRequest
 
@@ -11,23 +11,20 @@ class NightmareaiRealEsrgan(BaseRequest):
     guidance_scale: Optional[float] = Field(4, description="Factor to scale image by", ge=0, le=10)
     face_enhance: Optional[bool] = Field(False, description="Run GFPGAN face enhancement along with upscaling")
  
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "image": self.image,
-            "guidance_scale": self.guidance_scale,
-            "face_enhance": self.face_enhance,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("image", "guidance_scale", "face_enhance")
+
+    # Corresponds to api_path / required / x-order-properties in the interface configuration json
+    API_PATH: ClassVar[str] = "/api/v3/nightmareai/real-esrgan"
+    FIELD_REQUIRED: ClassVar[tuple] = ("image",)
+    FIELD_ORDER: ClassVar[tuple] = ("image", "guidance_scale", "face_enhance")
 
     def get_api_path(self):
-        """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
-        return "/api/v3/nightmareai/real-esrgan"
+        """Gets the API path for the request."""
+        return self.API_PATH
 
     def field_required(self):
-        """Corresponds to required in the interface configuration json"""
-        return ["image"]
+        return self.FIELD_REQUIRED
 
     def field_order(self):
-        """Corresponds to x-order-properties in the interface configuration json"""
-        return ["image", "guidance_scale", "face_enhance"]
+        """Get field order"""
+        return self.FIELD_ORDER
@@ -12,15 +12,7 @@ class SeedEditV3(BaseRequest):
     prompt: str = Field(..., description="The prompt describing desired modifications to the image.")
     seed: Optional[int] = Field(default=-1, description="\n            The same seed and the same prompt given to the same version of the model\n            will output the same image every time.\n        ")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "guidance_scale": self.guidance_scale,
-            "image": self.image,
-            "prompt": self.prompt,
-            "seed": self.seed,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("guidance_scale", "image", "prompt", "seed")
 
     def get_api_path(self):
         """Gets the API path. Corresponds to api_path in the JSON."""
@@ -15,18 +15,8 @@ class SkyReelsV1(BaseRequest):
     prompt: str = Field(..., description="The prompt to generate the video from.")
     seed: Optional[int] = Field(-1, description="Random seed for generation. If not provided, a random seed will be used.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "aspect_ratio": self.aspect_ratio,
-            "guidance_scale": self.guidance_scale,
-            "image": self.image,
-            "negative_prompt": self.negative_prompt,
-            "num_inference_steps": self.num_inference_steps,
-            "prompt": self.prompt,
-            "seed": self.seed,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("aspect_ratio", "guidance_scale", "image", "negative_prompt",
+                       "num_inference_steps", "prompt", "seed")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -29,18 +29,8 @@ class Step1xEdit(BaseRequest):
     enable_safety_checker: Optional[bool] = Field(
         default=True, description="If set to true, the safety checker will be enabled.")  # JSON notes 'disabled: true' for this field, which might mean it's not user-configurable through this schema or always true.
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "image": self.image,
-            "negative_prompt": self.negative_prompt,
-            "seed": self.seed,
-            "guidance_scale": self.guidance_scale,
-            "num_inference_steps": self.num_inference_steps,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "image", "negative_prompt", "seed", "guidance_scale",
+                       "num_inference_steps", "enable_safety_checker")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -20,20 +20,9 @@ class Uno(BaseRequest):
     output_format: Optional[str] = Field("jpeg", description="The format of the generated image.", enum=["jpeg", "png"])
     enable_safety_checker: Optional[bool] = Field(True, description="If set to true, the safety checker will be enabled.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "images": self.images,
-            "prompt": self.prompt,
-            "image_size": self.image_size,
-            "seed": self.seed,
-            "num_images": self.num_images,
-            "num_inference_steps": self.num_inference_steps,
-            "guidance_scale": self.guidance_scale,
-            "output_format": self.output_format,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("images", "prompt", "image_size", "seed", "num_images",
+                       "num_inference_steps", "guidance_scale", "output_format",
+                       "enable_safety_checker")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
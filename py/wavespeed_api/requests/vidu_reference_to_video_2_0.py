@@ -22,18 +22,8 @@ class ViduReferenceToVideo20(BaseRequest):
     movement_amplitude: Optional[str] = Field("auto", description="The movement amplitude of objects in the frame. Defaults to auto, accepted value: auto, small, medium, large.", enum=["auto", "small", "medium", "large"])
     seed: Optional[int] = Field(-1, description="The seed to use for generating the video. Random seed: Defaults to a random seed number; Manually set values will override the default random seed.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "images": self.images,
-            "prompt": self.prompt,
-            "aspect_ratio": self.aspect_ratio,
-            "duration": self.duration,
-            "movement_amplitude": self.movement_amplitude,
-            "seed": self.seed,
-        }
-        # No loras in this API based on the provided JSON
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("images", "prompt", "aspect_ratio", "duration", "movement_amplitude",
+                       "seed")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -19,16 +19,7 @@ class ViduStartEndToVideo20(BaseRequest):
     movement_amplitude: Optional[str] = Field("auto", description="The movement amplitude of objects in the frame. Defaults to auto, accepted value: auto small medium large.", enum=['auto', 'small', 'medium', 'large'])
     seed: Optional[int] = Field(-1, description="Random seed: Defaults to a random seed number; Manually set values will override the default random seed.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "images": self.images,
-            "prompt": self.prompt,
-            "duration": self.duration,
-            "movement_amplitude": self.movement_amplitude,
-            "seed": self.seed,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("images", "prompt", "duration", "movement_amplitude", "seed")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
@@ -21,21 +21,9 @@ class Wan21I2V480p(BaseRequest):
     seed: Optional[int] = Field(-1, description="The seed for random number generation.")
     enable_safety_checker: Optional[bool] = Field(True, description="Whether to enable the safety checker.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "image": self.image,
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "size": self.size,
-            "num_inference_steps": self.num_inference_steps,
-            "duration": self.duration,
-            "guidance_scale": self.guidance_scale,
-            "flow_shift": self.flow_shift,
-            "seed": self.seed,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("image", "prompt", "negative_prompt", "size", "num_inference_steps",
+                       "duration", "guidance_scale", "flow_shift", "seed",
+                       "enable_safety_checker")
 
     def get_api_path(self) -> str:
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
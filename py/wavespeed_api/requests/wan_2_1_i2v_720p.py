@@ -20,27 +20,9 @@ class Wan2x1I2V720p(BaseRequest):
     seed: Optional[int] = Field(-1, description="The seed for random number generation.")
     enable_safety_checker: Optional[bool] = Field(True, description="Whether to enable the safety checker.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "image": self.image,
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "size": self.size,
-            "num_inference_steps": self.num_inference_steps,
-            "duration": self.duration,
-            "guidance_scale": self.guidance_scale,
-            "flow_shift": self.flow_shift,
-            "seed": self.seed,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        # loras is not defined in the provided JSON schema for wan-2.1-i2v-720p
-        # if "loras" in payload and payload["loras"]:
-        #     # normalization_loras(loras, scale_max, scale_default)
-        #     # scale_max and scale_default should come from the API JSON if loras exist.
-        #     # Placeholder values are used here as they are not in the current JSON.
-        #     payload["loras"] = normalization_loras(payload["loras"], 1, 0.6)
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("image", "prompt", "negative_prompt", "size", "num_inference_steps",
+                       "duration", "guidance_scale", "flow_shift", "seed",
+                       "enable_safety_checker")
 
     def get_api_path(self) -> str:
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
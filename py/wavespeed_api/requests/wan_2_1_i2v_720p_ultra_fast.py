@@ -21,24 +21,9 @@ class Wan2x1I2V720pUltraFast(BaseRequest):
     seed: Optional[int] = Field(-1, description="The seed for random number generation.")
     enable_safety_checker: Optional[bool] = Field(True, description="Whether to enable the safety checker.")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "image": self.image,
-            "prompt": self.prompt,
-            "negative_prompt": self.negative_prompt,
-            "size": self.size,
-            "num_inference_steps": self.num_inference_steps,
-            "duration": self.duration,
-            "guidance_scale": self.guidance_scale,
-            "flow_shift": self.flow_shift,
-            "seed": self.seed,
-            "enable_safety_checker": self.enable_safety_checker,
-        }
-        # loras field is not present in the request_schema for this API
-        # if "loras" in payload:
-        #     payload["loras"] = normalization_loras(payload["loras"],1,0.6) # Example values, adjust if loras were present
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("image", "prompt", "negative_prompt", "size", "num_inference_steps",
+                       "duration", "guidance_scale", "flow_shift", "seed",
+                       "enable_safety_checker")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
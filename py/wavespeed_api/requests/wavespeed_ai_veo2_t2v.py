@@ -12,15 +12,7 @@ class WavespeedAiVeo2T2v(BaseRequest):
     aspect_ratio: Optional[str] = Field("16:9", description="Aspect ratio of the output video")
     duration: Optional[str] = Field("5s", description="Video duration in seconds")
 
-    def build_payload(self) -> dict:
-        """Builds the request payload dictionary."""
-        payload = {
-            "prompt": self.prompt,
-            "aspect_ratio": self.aspect_ratio,
-            "duration": self.duration,
-        }
-
-        return self._remove_empty_fields(payload)
+    _PAYLOAD_FIELDS = ("prompt", "aspect_ratio", "duration")
 
     def get_api_path(self):
         """Gets the API path for the request. Corresponds to api_path in the interface configuration json"""
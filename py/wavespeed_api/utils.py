@@ -1,5 +1,7 @@
 import requests
 import base64
+import concurrent.futures
+import functools
 import io
 import os
 import numpy
@@ -7,7 +9,7 @@ import PIL
 import requests
 import torch
 from collections.abc import Iterable
-from typing import List
+from typing import ClassVar, List
 from pydantic import BaseModel, Field
 from comfy_api.input import ImageInput, AudioInput, VideoInput
 import torchaudio
@@ -15,13 +17,14 @@ import av
 
 
 def imageurl2tensor(image_urls: List[str]):
-    images = []
     if not image_urls:
         return torch.zeros((1, 3, 1, 1))
-    for url in image_urls:
-        image_data = fetch_image(url)
-        image = decode_image(image_data)
-        images.append(image)
+    if len(image_urls) == 1:
+        images = [decode_image(fetch_image(image_urls[0]))]
+    else:
+        # Downloads are network-bound; fetch in parallel and decode in order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            images = [decode_image(data) for data in executor.map(fetch_image, image_urls)]
     return images2tensor(images)
 
 
@@ -196,11 +199,27 @@ def normalization_loras(loras, scale_max, scale_default):
     return _loras
 
 
+@functools.lru_cache(maxsize=None)
+def _payload_include(cls):
+    """Cached include-set for model_dump, one per request class."""
+    return frozenset(cls._PAYLOAD_FIELDS)
+
+
 class BaseRequest(BaseModel):
     """Base class for all API request objects."""
 
+    # Subclasses whose payload is a plain dump of their fields can list the
+    # field names here instead of overriding build_payload; the base
+    # implementation dumps them through pydantic-core and filters empties.
+    _PAYLOAD_FIELDS: ClassVar[tuple] = ()
+
     def build_payload(self):
         """Builds the request payload dictionary."""
+        if self._PAYLOAD_FIELDS:
+            # model_dump runs in pydantic-core (Rust), so field extraction
+            # and None filtering cost no Python-level per-field dispatch
+            payload = self.model_dump(include=_payload_include(type(self)), exclude_none=True)
+            return {k: v for k, v in payload.items() if v != "" and v != {}}
         raise NotImplementedError("Subclasses must implement build_payload")
 
     def get_api_path(self):
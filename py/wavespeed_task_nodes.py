@@ -4,11 +4,317 @@ WaveSpeed Task Create Node - Dynamic Task Creation Node
 This node is used to create and accumulate task parameters, supporting dynamic model selection and parameter configuration.
 """
 
+import functools
 import json
+import logging
+import threading
+
+import numpy
 
 from comfy.comfy_types.node_typing import IO as IO_TYPE
+from .wavespeed_api.client import WaveSpeedClient
 from .wavespeed_api.utils import imageurl2tensor
 
+_log = logging.getLogger("wavespeed")
+
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+    # existing except clauses keep working with either parser
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_json_cached(json_str):
+    """
+    Parse a JSON string, memoized on the raw string.
+
+    ComfyUI re-runs identical graphs often, so the same request_json and
+    param_map strings repeat across executions; caching skips the re-parse.
+    Callers that mutate the result must copy it first — cache entries are
+    shared.
+    """
+    return _loads(json_str) if json_str else {}
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_param_map(param_map_str):
+    """
+    Parse a param_map string into resolved (param_name, placeholder, type)
+    tuples, memoized on the raw string.
+
+    The same param_map repeats across executions of a node, so repeat runs
+    skip both the JSON parse and the format resolution. Handles the old
+    format (plain placeholder string) and the new format (object with
+    placeholder and type keys); entries without a placeholder are dropped.
+    """
+    param_mapping = _loads(param_map_str) if param_map_str else {}
+    resolved = []
+    for param_name, param_info in param_mapping.items():
+        if isinstance(param_info, str):
+            # Old format: param_info is just the placeholder name
+            resolved.append((param_name, param_info, "string"))
+        else:
+            # New format: object with placeholder and type info
+            placeholder_name = param_info.get("placeholder")
+            if placeholder_name:
+                resolved.append((param_name, placeholder_name,
+                                 param_info.get("type", "string")))
+    return tuple(resolved)
+
+
+@functools.lru_cache(maxsize=128)
+def _compiled_mapper(resolved):
+    """
+    Compile a resolved param mapping into a specialized mapper function.
+
+    Synthesizes straight-line code with the placeholder names and converter
+    calls inlined, so re-executions of the same graph skip the interpreted
+    loop entirely. Returns None if codegen fails; the caller falls back to
+    the generic loop.
+    """
+    lines = ["def _mapper(kwargs, request_json_dict):"]
+    namespace = {}
+    for i, (param_name, placeholder_name, param_type) in enumerate(resolved):
+        converter_name = f"_convert_{i}"
+        namespace[converter_name] = _CONVERTERS.get(param_type, _to_string)
+        # Missing and default-valued placeholders both fail the inequality,
+        # mirroring the generic loop
+        lines.append(f"    value = kwargs.get({placeholder_name!r}, {placeholder_name!r})")
+        lines.append(f"    if value != {placeholder_name!r}:")
+        lines.append(f"        request_json_dict[{param_name!r}] = {converter_name}(value)")
+    lines.append("    return request_json_dict")
+    try:
+        exec(compile("\n".join(lines), "<wavespeed param mapper>", "exec"), namespace)
+        return namespace["_mapper"]
+    except Exception as e:
+        _log.warning("Param-mapper codegen failed, using generic loop: %s", e)
+        return None
+
+
+# One WaveSpeedClient per api_key: the client owns a requests.Session with a
+# connection pool, so reusing it keeps TLS sessions and keep-alive connections
+# warm across node executions instead of handshaking on every call.
+_CLIENT_CACHE = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client(api_key):
+    """Return a cached WaveSpeedClient for api_key, creating it on first use."""
+    with _CLIENT_LOCK:
+        wavespeed_client = _CLIENT_CACHE.get(api_key)
+        if wavespeed_client is None:
+            wavespeed_client = WaveSpeedClient(api_key)
+            _CLIENT_CACHE[api_key] = wavespeed_client
+        return wavespeed_client
+
+
+# The array converters dispatch on type(value) through functools.singledispatch,
+# which caches the type-to-handler lookup in C instead of re-running isinstance
+# chains on every call.
+
+@functools.singledispatch
+def _to_str_array(value):
+    """Convert a value to a string array for the "array-str" type."""
+    result = [str(value)]
+    _log.debug("array-str conversion result: %r", result)
+    return result
+
+
+@_to_str_array.register(list)
+@_to_str_array.register(tuple)
+def _(value):
+    result = [str(item) for item in value]
+    _log.debug("array-str conversion result: %r", result)
+    return result
+
+
+@_to_str_array.register(str)
+def _(value):
+    # Handle comma-separated string input; strip once per token
+    result = [item for item in map(str.strip, value.split(',')) if item]
+    _log.debug("array-str conversion result: %r", result)
+    return result
+
+
+@functools.singledispatch
+def _to_num_array(value):
+    """Convert a value to a number array for the "array-int" type."""
+    try:
+        result = [float(value)]
+    except (ValueError, TypeError):
+        result = [str(value)]
+    _log.debug("array-int conversion result: %r", result)
+    return result
+
+
+@_to_num_array.register(list)
+@_to_num_array.register(tuple)
+def _(value):
+    try:
+        arr = numpy.asarray(value)
+    except (ValueError, TypeError, OverflowError):
+        arr = None
+    if arr is not None and (arr.dtype.kind in "iu"
+                            or (arr.dtype.kind == "f"
+                                and all(type(item) is float for item in value))):
+        # Homogeneous numeric sequences coerce in C. The dtype is inferred,
+        # not forced, so int sequences round-trip tolist() as Python ints and
+        # the wire format matches the per-item loop. A float dtype is only
+        # trusted when every element really is a float — numpy silently
+        # widens oversized ints to float64 — and bool, object, and other
+        # dtypes fall through to the loop below.
+        result = arr.tolist()
+    else:
+        converted = []
+        for item in value:
+            try:
+                if isinstance(item, (int, float)):
+                    converted.append(item)
+                else:
+                    converted.append(float(item))
+            except (ValueError, TypeError):
+                # If conversion fails, keep as string
+                converted.append(str(item))
+        result = converted
+    _log.debug("array-int conversion result: %r", result)
+    return result
+
+
+@_to_num_array.register(str)
+def _(value):
+    # Handle comma-separated string input; strip once per token
+    converted = []
+    for item in map(str.strip, value.split(',')):
+        if item:
+            try:
+                converted.append(float(item))
+            except ValueError:
+                converted.append(item)
+    result = converted
+    _log.debug("array-int conversion result: %r", result)
+    return result
+
+
+def _to_lora_weight(value):
+    """Convert LoraWeight input - supports WAVESPEED_LORAS, JSON structures, and string formats."""
+    # Case 1: Already structured data (from frontend JSON parsing or WAVESPEED_LORAS)
+    if isinstance(value, dict):
+        # Single LoraWeight object - validate it has required fields
+        if 'path' in value and 'scale' in value:
+            result = value
+            _log.debug("lora-weight (structured single object) conversion result: %r", result)
+            return result
+        else:
+            _log.warning("Invalid LoRA object, missing required fields: %r", value)
+            result = {}
+    elif isinstance(value, list):
+        # Array of LoraWeight objects - validate each item
+        valid_loras = []
+        for item in value:
+            if isinstance(item, dict) and 'path' in item and 'scale' in item:
+                valid_loras.append(item)
+            else:
+                _log.warning("Invalid LoRA item, skipping: %r", item)
+        result = valid_loras
+        _log.debug("lora-weight (structured array) conversion result: %r", result)
+        return result
+    elif hasattr(value, '__iter__') and not isinstance(value, str):
+        # Handle other iterable inputs (WAVESPEED_LORAS fallback)
+        if len(value) > 0 and isinstance(value[0], dict) and 'path' in value[0] and 'scale' in value[0]:
+            result = list(value)
+            _log.debug("lora-weight (WAVESPEED_LORAS) conversion result: %r", result)
+            return result
+        result = list(value)
+    elif isinstance(value, str):
+        # Handle JSON string input (fallback for legacy or manual input)
+        if value.strip().startswith('{') and value.strip().endswith('}'):
+            # Single LoraWeight object
+            try:
+                parsed = json.loads(value)
+                if isinstance(parsed, dict):
+                    # Validate single LoRA object has required fields
+                    if 'path' not in parsed or 'scale' not in parsed:
+                        raise ValueError("LoRA object must have 'path' and 'scale' fields")
+                    result = parsed  # Return single object, not array
+                    _log.debug("lora-weight (single JSON string) conversion result: %r", result)
+                    return result
+            except (json.JSONDecodeError, ValueError) as e:
+                _log.warning("Failed to parse single LoRA JSON: %s", e)
+                result = {}
+        elif value.strip().startswith('[') and value.strip().endswith(']'):
+            # Array of LoraWeight objects
+            try:
+                parsed = json.loads(value)
+                if isinstance(parsed, list):
+                    # Validate each item has required fields
+                    for item in parsed:
+                        if not isinstance(item, dict) or 'path' not in item or 'scale' not in item:
+                            raise ValueError("Each LoRA item must have 'path' and 'scale' fields")
+                    result = parsed
+                    _log.debug("lora-weight (JSON array string) conversion result: %r", result)
+                    return result
+            except (json.JSONDecodeError, ValueError) as e:
+                _log.warning("Failed to parse LoRA JSON array: %s", e)
+                result = []
+        else:
+            # Handle comma-separated format: path1:scale1,path2:scale2
+            loras = []
+            if value.strip():
+                pairs = [pair.strip() for pair in value.split(',') if pair.strip()]
+                for pair in pairs:
+                    if ':' in pair:
+                        path, scale_str = pair.split(':', 1)
+                        try:
+                            scale = float(scale_str.strip())
+                            loras.append({"path": path.strip(), "scale": scale})
+                        except ValueError:
+                            _log.warning("Invalid scale value in LoRA pair: %r", pair)
+                    else:
+                        # Default scale if not specified
+                        loras.append({"path": pair.strip(), "scale": 1.0})
+            result = loras
+    else:
+        result = {}  # Default to empty object for single LoRA, empty list for array
+    _log.debug("lora-weight conversion result: %r", result)
+    return result
+
+
+def _to_number(value):
+    """Convert a value to a number, returning it unchanged on failure."""
+    # Exact-type check first: typed widget inputs are already int/float, and
+    # `type(...) is` skips isinstance's tuple walk on this hot path
+    t = type(value)
+    if t is int or t is float or t is bool:
+        # bool stays in the fast path so it passes through unchanged, as the
+        # isinstance check it replaces did (bool subclasses int)
+        return value
+    try:
+        result = float(value)
+    except (ValueError, TypeError):
+        result = value  # Return as-is if conversion fails
+    _log.debug("number conversion result: %r", result)
+    return result
+
+
+def _to_string(value):
+    """Default conversion: treat the value as a string."""
+    result = str(value) if value is not None else ""
+    _log.debug("string conversion result: %r", result)
+    return result
+
+
+# Type-name to handler dispatch; unknown types fall back to string
+_CONVERTERS = {
+    "array-str": _to_str_array,
+    "array-int": _to_num_array,
+    "lora-weight": _to_lora_weight,
+    "number": _to_number,
+    "string": _to_string,
+}
+
 
 def convert_parameter_value(value, param_type):
     """
@@ -21,156 +327,29 @@ def convert_parameter_value(value, param_type):
     Returns:
         Converted value appropriate for the API
     """
-    print(f"[WaveSpeed] Converting value {value} (type: {type(value)}) to {param_type}")
-
-    if param_type == "array-str":
-        # Convert to string array
-        if isinstance(value, list):
-            result = [str(item) for item in value]
-        elif isinstance(value, str):
-            # Handle comma-separated string input
-            result = [item.strip() for item in value.split(',') if item.strip()]
-        else:
-            result = [str(value)]
-        print(f"[WaveSpeed] array-str conversion result: {result}")
-        return result
+    _log.debug("Converting value %r (type: %s) to %s", value, type(value), param_type)
+    return _CONVERTERS.get(param_type, _to_string)(value)
 
-    elif param_type == "array-int":
-        # Convert to number array
-        if isinstance(value, list):
-            converted = []
-            for item in value:
-                try:
-                    if isinstance(item, (int, float)):
-                        converted.append(item)
-                    else:
-                        converted.append(float(item))
-                except (ValueError, TypeError):
-                    # If conversion fails, keep as string
-                    converted.append(str(item))
-            result = converted
-        elif isinstance(value, str):
-            # Handle comma-separated string input
-            converted = []
-            for item in value.split(','):
-                item = item.strip()
-                if item:
-                    try:
-                        converted.append(float(item))
-                    except ValueError:
-                        converted.append(item)
-            result = converted
-        else:
-            try:
-                result = [float(value)]
-            except (ValueError, TypeError):
-                result = [str(value)]
-        print(f"[WaveSpeed] array-int conversion result: {result}")
-        return result
 
-    elif param_type == "lora-weight":
-        # Convert LoraWeight type - supports WAVESPEED_LORAS input, JSON structures, and string formats
+# Media classification: extract the extension once, then O(1) set lookups
+_VIDEO_EXTS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm'})
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+_AUDIO_EXTS = frozenset({'.mp3', '.wav', '.m4a', '.flac'})
 
-        # Case 1: Already structured data (from frontend JSON parsing or WAVESPEED_LORAS)
-        if isinstance(value, dict):
-            # Single LoraWeight object - validate it has required fields
-            if 'path' in value and 'scale' in value:
-                result = value
-                print(f"[WaveSpeed] lora-weight (structured single object) conversion result: {result}")
-                return result
-            else:
-                print(f"[WaveSpeed] Invalid LoRA object, missing required fields: {value}")
-                result = {}
-        elif isinstance(value, list):
-            # Array of LoraWeight objects - validate each item
-            valid_loras = []
-            for item in value:
-                if isinstance(item, dict) and 'path' in item and 'scale' in item:
-                    valid_loras.append(item)
-                else:
-                    print(f"[WaveSpeed] Invalid LoRA item, skipping: {item}")
-            result = valid_loras
-            print(f"[WaveSpeed] lora-weight (structured array) conversion result: {result}")
-            return result
-        elif hasattr(value, '__iter__') and not isinstance(value, str):
-            # Handle other iterable inputs (WAVESPEED_LORAS fallback)
-            if len(value) > 0 and isinstance(value[0], dict) and 'path' in value[0] and 'scale' in value[0]:
-                result = list(value)
-                print(f"[WaveSpeed] lora-weight (WAVESPEED_LORAS) conversion result: {result}")
-                return result
-            result = list(value)
-        elif isinstance(value, str):
-            # Handle JSON string input (fallback for legacy or manual input)
-            if value.strip().startswith('{') and value.strip().endswith('}'):
-                # Single LoraWeight object
-                try:
-                    import json
-                    parsed = json.loads(value)
-                    if isinstance(parsed, dict):
-                        # Validate single LoRA object has required fields
-                        if 'path' not in parsed or 'scale' not in parsed:
-                            raise ValueError("LoRA object must have 'path' and 'scale' fields")
-                        result = parsed  # Return single object, not array
-                        print(f"[WaveSpeed] lora-weight (single JSON string) conversion result: {result}")
-                        return result
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"[WaveSpeed] Failed to parse single LoRA JSON: {e}")
-                    result = {}
-            elif value.strip().startswith('[') and value.strip().endswith(']'):
-                # Array of LoraWeight objects
-                try:
-                    import json
-                    parsed = json.loads(value)
-                    if isinstance(parsed, list):
-                        # Validate each item has required fields
-                        for item in parsed:
-                            if not isinstance(item, dict) or 'path' not in item or 'scale' not in item:
-                                raise ValueError("Each LoRA item must have 'path' and 'scale' fields")
-                        result = parsed
-                        print(f"[WaveSpeed] lora-weight (JSON array string) conversion result: {result}")
-                        return result
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"[WaveSpeed] Failed to parse LoRA JSON array: {e}")
-                    result = []
-            else:
-                # Handle comma-separated format: path1:scale1,path2:scale2
-                loras = []
-                if value.strip():
-                    pairs = [pair.strip() for pair in value.split(',') if pair.strip()]
-                    for pair in pairs:
-                        if ':' in pair:
-                            path, scale_str = pair.split(':', 1)
-                            try:
-                                scale = float(scale_str.strip())
-                                loras.append({"path": path.strip(), "scale": scale})
-                            except ValueError:
-                                print(f"[WaveSpeed] Invalid scale value in LoRA pair: {pair}")
-                        else:
-                            # Default scale if not specified
-                            loras.append({"path": pair.strip(), "scale": 1.0})
-                result = loras
-        else:
-            result = {}  # Default to empty object for single LoRA, empty list for array
-        print(f"[WaveSpeed] lora-weight conversion result: {result}")
-        return result
 
-    elif param_type == "number":
-        # Convert to number
-        try:
-            if isinstance(value, (int, float)):
-                result = value
-            else:
-                result = float(value)
-        except (ValueError, TypeError):
-            result = value  # Return as-is if conversion fails
-        print(f"[WaveSpeed] number conversion result: {result}")
-        return result
+def _media_ext(output):
+    """
+    Lowercased extension of a URL or path, query string/fragment stripped.
 
-    else:
-        # Default: treat as string
-        result = str(value) if value is not None else ""
-        print(f"[WaveSpeed] string conversion result: {result}")
-        return result
+    Only the last few characters are examined, so long text outputs never
+    pay a copy proportional to their length.
+    """
+    path = output.split('?', 1)[0].split('#', 1)[0]
+    # Longest recognized extension is 5 chars including the dot ('.jpeg')
+    dot = path.rfind('.', max(0, len(path) - 5))
+    if dot <= 0 or '/' in path[dot:]:
+        return ''
+    return path[dot:].lower()
 
 
 class WaveSpeedOutputProcessor:
@@ -200,24 +379,28 @@ class WaveSpeedOutputProcessor:
         if outputs and len(outputs) > 0:
             # Try to determine output types and separate them
             for output in outputs:
-                if isinstance(output, str):
-                    output_lower = output.lower()
-                    if any(ext in output_lower for ext in ['.mp4', '.mov', '.avi', '.mkv', '.webm']):
-                        if not video_url:  # Take the first video
-                            video_url = output
-                    elif any(ext in output_lower for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
-                        try:
-                            images.append(output)
-                        except Exception as e:
-                            print(f"Failed to load image: {e}")
-                    elif any(ext in output_lower for ext in ['.mp3', '.wav', '.m4a', '.flac']):
-                        if not audio_url:  # Take the first audio
-                            audio_url = output
-                    else:
-                        # For other outputs that are not media files, check if they are actually text content
-                        # Only consider non-URL strings as text content
-                        if not text and not output.startswith(('http://', 'https://', 'ftp://', 'data:')):
-                            text = output
+                if not isinstance(output, str):
+                    continue
+                if not output.startswith(('http://', 'https://', 'ftp://', 'data:')):
+                    # Non-URL strings are generated text content; deciding
+                    # this first keeps extension scanning off (possibly
+                    # large) text outputs
+                    if not text:
+                        text = output
+                    continue
+                ext = _media_ext(output)
+                if ext in _IMAGE_EXTS:
+                    images.append(output)
+                elif video_url and audio_url:
+                    # Remaining single-value slots are filled; only images
+                    # can still be collected, so skip the rest
+                    continue
+                elif ext in _VIDEO_EXTS:
+                    if not video_url:  # Take the first video
+                        video_url = output
+                elif ext in _AUDIO_EXTS:
+                    if not audio_url:  # Take the first audio
+                        audio_url = output
 
             # Don't auto-assign first output as text - text should only be actual generated text content
         image = imageurl2tensor(images)
@@ -231,9 +414,13 @@ class DynamicRequest:
     Dynamic request class that can handle any API endpoint and parameters
     """
 
+    __slots__ = ("model_uuid", "request_json", "api_path")
+
     def __init__(self, model_uuid: str, request_json: dict):
         self.model_uuid = model_uuid
         self.request_json = request_json
+        # Formatted once; get_api_path can be called on every poll
+        self.api_path = f"/api/v3/{model_uuid}"
 
     def build_payload(self) -> dict:
         """Build the request payload"""
@@ -241,7 +428,7 @@ class DynamicRequest:
 
     def get_api_path(self) -> str:
         """Get the API path for this model"""
-        return f"/api/v3/{self.model_uuid}"
+        return self.api_path
 
 
 class WaveSpeedTaskCreateDynamic:
@@ -255,37 +442,20 @@ class WaveSpeedTaskCreateDynamic:
     def __init__(self):
         pass
 
+    # Built once at import; ComfyUI calls INPUT_TYPES repeatedly during graph
+    # validation and the node only reads the dict, so one shared copy is safe
+    _CACHED_INPUT_TYPES = {
+        "optional": {f"param_{i}": (IO_TYPE.ANY,) for i in range(1, 21)},
+        "hidden": {
+            "model_id": IO_TYPE.STRING,
+            "request_json": IO_TYPE.STRING,
+            "param_map": IO_TYPE.STRING,
+        },
+    }
+
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "optional": {
-                "param_1": (IO_TYPE.ANY,),
-                "param_2": (IO_TYPE.ANY,),
-                "param_3": (IO_TYPE.ANY,),
-                "param_4": (IO_TYPE.ANY,),
-                "param_5": (IO_TYPE.ANY,),
-                "param_6": (IO_TYPE.ANY,),
-                "param_7": (IO_TYPE.ANY,),
-                "param_8": (IO_TYPE.ANY,),
-                "param_9": (IO_TYPE.ANY,),
-                "param_10": (IO_TYPE.ANY,),
-                "param_11": (IO_TYPE.ANY,),
-                "param_12": (IO_TYPE.ANY,),
-                "param_13": (IO_TYPE.ANY,),
-                "param_14": (IO_TYPE.ANY,),
-                "param_15": (IO_TYPE.ANY,),
-                "param_16": (IO_TYPE.ANY,),
-                "param_17": (IO_TYPE.ANY,),
-                "param_18": (IO_TYPE.ANY,),
-                "param_19": (IO_TYPE.ANY,),
-                "param_20": (IO_TYPE.ANY,),
-            },
-            "hidden": {
-                "model_id": IO_TYPE.STRING,
-                "request_json": IO_TYPE.STRING,
-                "param_map": IO_TYPE.STRING,
-            },
-        }
+        return cls._CACHED_INPUT_TYPES
 
     RETURN_TYPES = ("TASK_INFO",)
     RETURN_NAMES = ("task_info",)
@@ -321,57 +491,54 @@ class WaveSpeedTaskCreateDynamic:
             Old format: {"images": "param_2"}
         """
         try:
-            # Parse the request JSON (containing widget-based parameters)
+            # Parse the request JSON (containing widget-based parameters).
+            # The cached dict is shared, so copy before mutating it below.
             try:
-                request_json_dict = json.loads(
-                    request_json) if request_json else {}
+                request_json_dict = dict(_parse_json_cached(request_json))
             except json.JSONDecodeError:
                 request_json_dict = {}
 
-            # Parse the parameter mapping
+            # Parse and resolve the parameter mapping; memoized on the raw
+            # string, so repeat runs of the same node cost one cache lookup
             try:
-                param_mapping = json.loads(param_map) if param_map else {}
+                resolved = _resolve_param_map(param_map)
             except json.JSONDecodeError:
-                param_mapping = {}
-
-            print(f"[WaveSpeed] Execute with model_id: {model_id}")
-            print(f"[WaveSpeed] Base request_json: {request_json_dict}")
-            print(f"[WaveSpeed] Param mapping: {param_mapping}")
-
-            # Process param_* placeholders and map them to actual parameter names
-            for param_name, param_info in param_mapping.items():
-                # Handle both old format (string) and new format (object)
-                if isinstance(param_info, str):
-                    # Old format: param_info is just the placeholder name
-                    placeholder_name = param_info
-                    param_type = "string"  # Default type for backward compatibility
-                else:
-                    # New format: param_info is an object with placeholder and type info
-                    placeholder_name = param_info.get("placeholder")
-                    param_type = param_info.get("type", "string")
+                resolved = ()
 
-                if placeholder_name and placeholder_name in kwargs:
-                    placeholder_value = kwargs[placeholder_name]
+            _log.debug("Execute with model_id: %s", model_id)
+            _log.debug("Base request_json: %r", request_json_dict)
+            _log.debug("Resolved param mapping: %r", resolved)
 
-                    # Skip default placeholder values
+            # Map param_* placeholders to actual parameter names, preferring
+            # the compiled mapper specialized for this exact mapping
+            mapper = _compiled_mapper(resolved) if resolved else None
+            if mapper is not None:
+                mapper(kwargs, request_json_dict)
+            else:
+                # Generic loop: .get with the placeholder name as default
+                # fuses the membership test and lookup — missing and
+                # default-valued placeholders both fail the inequality
+                for param_name, placeholder_name, param_type in resolved:
+                    placeholder_value = kwargs.get(placeholder_name, placeholder_name)
                     if placeholder_value != placeholder_name:
-                        # Convert the value based on the parameter type
                         converted_value = convert_parameter_value(placeholder_value, param_type)
                         request_json_dict[param_name] = converted_value
-                        print(
-                            f"[WaveSpeed] Mapped {param_name} = {converted_value} (from {placeholder_name}, type: {param_type})")
+                        _log.debug("Mapped %s = %r (from %s, type: %s)",
+                                   param_name, converted_value, placeholder_name, param_type)
 
             # Initialize the return data structure
             task_info_result = {
                 "modelUUID": model_id,
-                "requestJson": request_json_dict.copy(),
+                # No defensive copy: the dict is local and submit_task copies
+                # before consuming it
+                "requestJson": request_json_dict,
             }
 
-            print(f"[WaveSpeed] Final request JSON: {request_json_dict}")
+            _log.debug("Final request JSON: %r", request_json_dict)
             return (task_info_result,)
 
         except Exception as e:
-            print(f"[WaveSpeed] Error in execute: {e}")
+            _log.error("Error in execute: %s", e)
             raise e
 
     @classmethod
@@ -447,11 +614,8 @@ class WaveSpeedTaskSubmit:
             raise ValueError("Missing modelUUID in task_info")
 
         try:
-            # Import required modules
-            from .wavespeed_api.client import WaveSpeedClient
-
-            # Initialize the client
-            wavespeed_client = WaveSpeedClient(client["api_key"])
+            # Reuse the pooled client for this api_key
+            wavespeed_client = _get_client(client["api_key"])
 
             # Get request parameters directly
             request_json = task_info.get("requestJson", {}).copy()
@@ -548,11 +712,8 @@ class WaveSpeedTaskStatus:
             raise ValueError("No task ID provided")
 
         try:
-            # Import required modules
-            from .wavespeed_api.client import WaveSpeedClient
-
-            # Initialize the client
-            wavespeed_client = WaveSpeedClient(client["api_key"])
+            # Reuse the pooled client for this api_key
+            wavespeed_client = _get_client(client["api_key"])
 
             print(f"Checking status for task {task_id}")
 